@@ -1,5 +1,8 @@
+import functools
+import queue
+import threading
 from abc import ABC, abstractmethod
-from enum import Enum, auto
+from enum import Enum, IntEnum, auto
 from typing import Callable, Set
 
 from utils import ConfigManager
@@ -11,7 +14,7 @@ class InputEvent(Enum):
     MOUSE_PRESS = auto()
     MOUSE_RELEASE = auto()
 
-class KeyCode(Enum):
+class KeyCode(IntEnum):
     # Modifier keys
     CTRL_LEFT = auto()
     CTRL_RIGHT = auto()
@@ -199,6 +202,34 @@ class KeyCode(Enum):
     MOUSE_SIDE2 = auto()
     MOUSE_SIDE3 = auto()
 
+# Stable bit index per KeyCode so chord activation can be checked with
+# integer bitmask operations instead of set membership walks.
+KEYCODE_BIT = {key_code: 1 << index for index, key_code in enumerate(KeyCode)}
+
+# Tokens that expand to either of a pair of physical keys.
+_MODIFIER_GROUPS = {
+    'CTRL': frozenset({KeyCode.CTRL_LEFT, KeyCode.CTRL_RIGHT}),
+    'SHIFT': frozenset({KeyCode.SHIFT_LEFT, KeyCode.SHIFT_RIGHT}),
+    'ALT': frozenset({KeyCode.ALT_LEFT, KeyCode.ALT_RIGHT}),
+    'META': frozenset({KeyCode.META_LEFT, KeyCode.META_RIGHT}),
+}
+
+@functools.lru_cache(maxsize=64)
+def _parse_key_combination(combination_string: str) -> frozenset[KeyCode | frozenset[KeyCode]]:
+    """Parse a key-combination string into a frozenset of KeyCodes, memoized by the raw string."""
+    keys = set()
+    for key in combination_string.upper().split('+'):
+        key = key.strip()
+        if key in _MODIFIER_GROUPS:
+            keys.add(_MODIFIER_GROUPS[key])
+        else:
+            keycode = KeyCode.__members__.get(key)
+            if keycode is not None:
+                keys.add(keycode)
+            else:
+                print(f"Unknown key: {key}, in key combination: {combination_string}.")
+    return frozenset(keys)
+
 class InputBackend(ABC):
     """
     Abstract base class for input backends.
@@ -248,28 +279,47 @@ class KeyChord:
     """
 
     def __init__(self, keys: Set[KeyCode | frozenset[KeyCode]]):
-        """Initialize the KeyChord."""
+        """Initialize the KeyChord, precomputing bitmasks for the activation check."""
         self.keys = keys
-        self.pressed_keys: Set[KeyCode] = set()
+        self.pressed_bits = 0
+
+        # Solo keys collapse into a single required mask; each frozenset of
+        # alternatives (e.g. left/right ctrl) becomes its own group mask.
+        self.required_mask = 0
+        self.group_masks = []
+        for key in keys:
+            if isinstance(key, frozenset):
+                group_mask = 0
+                for k in key:
+                    group_mask |= KEYCODE_BIT[k]
+                self.group_masks.append(group_mask)
+            else:
+                self.required_mask |= KEYCODE_BIT[key]
 
-    def update(self, key: KeyCode, event_type: InputEvent) -> bool:
-        """Update the state of pressed keys and check if the chord is active."""
+        self._active = self._compute_active()
+
+    def update(self, key: KeyCode, event_type: InputEvent):
+        """Update the state of pressed keys; the cached activation state is recomputed only when the state changed."""
+        bit = KEYCODE_BIT[key]
         if event_type == InputEvent.KEY_PRESS:
-            self.pressed_keys.add(key)
+            new_bits = self.pressed_bits | bit
         elif event_type == InputEvent.KEY_RELEASE:
-            self.pressed_keys.discard(key)
+            new_bits = self.pressed_bits & ~bit
+        else:
+            return
 
-        return self.is_active()
+        if new_bits != self.pressed_bits:
+            self.pressed_bits = new_bits
+            self._active = self._compute_active()
 
     def is_active(self) -> bool:
         """Check if all keys in the chord are currently pressed."""
-        for key in self.keys:
-            if isinstance(key, frozenset):
-                if not any(k in self.pressed_keys for k in key):
-                    return False
-            elif key not in self.pressed_keys:
-                return False
-        return True
+        return self._active
+
+    def _compute_active(self) -> bool:
+        if (self.pressed_bits & self.required_mask) != self.required_mask:
+            return False
+        return all(self.pressed_bits & group_mask for group_mask in self.group_masks)
 
 class KeyListener:
     """
@@ -317,27 +367,9 @@ class KeyListener:
         clipboard_only_keys = self.parse_key_combination(clipboard_only_key)
         self.set_activation_keys(typing_only_keys, typing_and_clipboard_keys, clipboard_only_keys)
 
-    def parse_key_combination(self, combination_string: str) -> Set[KeyCode | frozenset[KeyCode]]:
+    def parse_key_combination(self, combination_string: str) -> frozenset[KeyCode | frozenset[KeyCode]]:
         """Parse a string representation of key combination into a set of KeyCodes."""
-        keys = set()
-        key_map = {
-            'CTRL': frozenset({KeyCode.CTRL_LEFT, KeyCode.CTRL_RIGHT}),
-            'SHIFT': frozenset({KeyCode.SHIFT_LEFT, KeyCode.SHIFT_RIGHT}),
-            'ALT': frozenset({KeyCode.ALT_LEFT, KeyCode.ALT_RIGHT}),
-            'META': frozenset({KeyCode.META_LEFT, KeyCode.META_RIGHT}),
-        }
-
-        for key in combination_string.upper().split('+'):
-            key = key.strip()
-            if key in key_map:
-                keys.add(key_map[key])
-            else:
-                try:
-                    keycode = KeyCode[key]
-                    keys.add(keycode)
-                except KeyError:
-                    print(f"Unknown key: {key}, in key combination: {combination_string}.")
-        return keys
+        return _parse_key_combination(combination_string)
 
     def set_activation_keys(self, 
             typing_only_keys: Set[KeyCode], 
@@ -350,6 +382,26 @@ class KeyListener:
         self.typing_and_clipboard_chord = KeyChord(typing_and_clipboard_keys)
         self.clipboard_only_chord = KeyChord(clipboard_only_keys)
 
+        # Union of every key appearing in any chord, so events for
+        # unrelated keys can be rejected without touching the chords.
+        relevant_keys = set()
+        for key in typing_only_keys | typing_and_clipboard_keys | clipboard_only_keys:
+            if isinstance(key, frozenset):
+                relevant_keys.update(key)
+            else:
+                relevant_keys.add(key)
+        self._relevant_keys = frozenset(relevant_keys)
+
+        # Seed from the chords' real state: an empty chord (blank or
+        # unparseable key string) is active from construction, and a
+        # hardcoded False seed would fire a spurious activation edge on
+        # the first relevant event.
+        self._prev_active = (
+            self.typing_only_chord.is_active(),
+            self.typing_and_clipboard_chord.is_active(),
+            self.clipboard_only_chord.is_active()
+        )
+
     def on_input_event(self, event):
         """Handle input events and trigger callbacks if the key chord becomes active or inactive."""
         if not self.typing_only_chord or not self.input_backend:
@@ -357,24 +409,26 @@ class KeyListener:
 
         key, event_type = event
 
-        was_active = {
-            "typing_only": self.typing_only_chord.is_active(),
-            "typing_and_clipboard": self.typing_and_clipboard_chord.is_active(),
-            "clipboard_only": self.clipboard_only_chord.is_active()
-        }
-        is_active = {
-            "typing_only": self.typing_only_chord.update(key, event_type),
-            "typing_and_clipboard": self.typing_and_clipboard_chord.update(key, event_type),
-            "clipboard_only": self.clipboard_only_chord.update(key, event_type)
-        }
+        if key not in self._relevant_keys:
+            return
+
+        was_typing, was_typing_clipboard, was_clipboard = self._prev_active
+        self.typing_only_chord.update(key, event_type)
+        self.typing_and_clipboard_chord.update(key, event_type)
+        self.clipboard_only_chord.update(key, event_type)
+        now_typing = self.typing_only_chord.is_active()
+        now_typing_clipboard = self.typing_and_clipboard_chord.is_active()
+        now_clipboard = self.clipboard_only_chord.is_active()
+        self._prev_active = (now_typing, now_typing_clipboard, now_clipboard)
 
-        if not was_active["typing_only"] and is_active["typing_only"]:
+        if not was_typing and now_typing:
             self._trigger_callbacks("on_activate_typing_only")
-        elif not was_active["typing_and_clipboard"] and is_active["typing_and_clipboard"]:
+        elif not was_typing_clipboard and now_typing_clipboard:
             self._trigger_callbacks("on_activate_typing_and_clipboard")
-        elif not was_active["clipboard_only"] and is_active["clipboard_only"]:
+        elif not was_clipboard and now_clipboard:
             self._trigger_callbacks("on_activate_clipboard_only")
-        elif any(was_active.values()) and not any(is_active.values()):
+        elif ((was_typing or was_typing_clipboard or was_clipboard)
+                and not (now_typing or now_typing_clipboard or now_clipboard)):
             self._trigger_callbacks("on_deactivate")
 
     def add_callback(self, event: str, callback: Callable):
@@ -391,6 +445,18 @@ class KeyListener:
         """Update activation keys from the current configuration."""
         self.load_activation_keys_from_config()
 
+# Pynput-to-KeyCode translation table, built once on first use and shared
+# across start/stop cycles.
+_KEY_MAP = None
+
+# Secondary table keyed on raw virtual-key codes (plain ints), checked
+# before the pynput object lookup.
+_VK_MAP = None
+
+# Maximum number of queued raw events translated per batch by the dispatch
+# thread, so high-polling-rate devices are drained in one wakeup.
+_EVENT_BATCH_SIZE = 32
+
 class PynputBackend(InputBackend):
     """
     Input backend implementation using the pynput library.
@@ -412,14 +478,25 @@ class PynputBackend(InputBackend):
         self.keyboard = None
         self.mouse = None
         self.key_map = None
+        self.vk_map = None
+        self.event_queue = None
+        self.dispatch_thread = None
 
     def start(self):
-        """Start listening for keyboard and mouse events."""
+        """Start listening for keyboard and mouse events. Safe to call repeatedly: already-running listener threads are kept alive."""
+        if self.keyboard_listener is not None:
+            return
+
         if self.keyboard is None or self.mouse is None:
             from pynput import keyboard, mouse
             self.keyboard = keyboard
             self.mouse = mouse
             self.key_map = self._create_key_map()
+            self.vk_map = self._create_vk_map()
+
+        self.event_queue = queue.Queue()
+        self.dispatch_thread = threading.Thread(target=self._dispatch_loop, daemon=True)
+        self.dispatch_thread.start()
 
         self.keyboard_listener = self.keyboard.Listener(
             on_press=self._on_keyboard_press,
@@ -440,37 +517,78 @@ class PynputBackend(InputBackend):
         if self.mouse_listener:
             self.mouse_listener.stop()
             self.mouse_listener = None
+        if self.dispatch_thread:
+            self.event_queue.put_nowait(None)
+            self.dispatch_thread.join()
+            self.dispatch_thread = None
+            self.event_queue = None
+
+    def _dispatch_loop(self):
+        """Drain queued raw events in batches and dispatch them."""
+        while True:
+            item = self.event_queue.get()
+            batch = [item]
+            while len(batch) < _EVENT_BATCH_SIZE:
+                try:
+                    batch.append(self.event_queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            for item in batch:
+                if item is None:  # Sentinel pushed by stop().
+                    return
+                raw_key, is_press = item
+                translated_event = self._translate_key_event(raw_key, is_press)
+                if translated_event is not None:
+                    self.on_input_event(translated_event)
+
+    def _translate_key_event(self, key_event, is_press) -> tuple[KeyCode, InputEvent] | None:
+        """Translate a pynput event to our internal event representation, or None if the key is unknown."""
+
+        vk = getattr(key_event, 'vk', None)
+        key_code = self.vk_map.get(vk) if vk is not None else None
+        if key_code is None:
+            key_code = self.key_map.get(key_event)
+        if key_code is None:
+            return None
 
-    def _translate_key_event(self, key_event, is_press) -> tuple[KeyCode, InputEvent]:
-        """Translate a pynput event to our internal event representation."""
-        
-        key_code = self.key_map.get(key_event, KeyCode.SPACE)
         event_type = InputEvent.KEY_PRESS if is_press else InputEvent.KEY_RELEASE
-        return key_code, event_type 
-        
+        return key_code, event_type
+
     def _on_keyboard_press(self, key):
         """Handle keyboard press events."""
 
-        key = self.keyboard_listener.canonical(key)
-        translated_event = self._translate_key_event(key, True)
-        self.on_input_event(translated_event)
+        # Snapshot into locals: pynput may still deliver a late callback
+        # after stop() has cleared these attributes.
+        listener = self.keyboard_listener
+        event_queue = self.event_queue
+        if listener is None or event_queue is None:
+            return
+        event_queue.put_nowait((listener.canonical(key), True))
 
     def _on_keyboard_release(self, key):
         """Handle keyboard release events."""
 
-        key = self.keyboard_listener.canonical(key)
-        translated_event = self._translate_key_event(key, False)
-        self.on_input_event(translated_event)
+        listener = self.keyboard_listener
+        event_queue = self.event_queue
+        if listener is None or event_queue is None:
+            return
+        event_queue.put_nowait((listener.canonical(key), False))
 
     def _on_mouse_click(self, x, y, button, pressed):
         """Handle mouse click events."""
-        
-        translated_event = self._translate_key_event(button, pressed)
-        self.on_input_event(translated_event)
+
+        event_queue = self.event_queue
+        if event_queue is not None:
+            event_queue.put_nowait((button, pressed))
 
     def _create_key_map(self):
         """Create a mapping from pynput keys to our internal KeyCode enum."""
-        return {
+        global _KEY_MAP
+        if _KEY_MAP is not None:
+            return _KEY_MAP
+
+        _KEY_MAP = {
             # Modifier keys
             self.keyboard.Key.ctrl: KeyCode.CTRL_LEFT,
             self.keyboard.Key.ctrl_l: KeyCode.CTRL_LEFT,
@@ -615,6 +733,18 @@ class PynputBackend(InputBackend):
             self.mouse.Button.right: KeyCode.MOUSE_RIGHT,
             self.mouse.Button.middle: KeyCode.MOUSE_MIDDLE,
         }
+        return _KEY_MAP
+
+    def _create_vk_map(self):
+        """Create a mapping from raw virtual-key codes to KeyCode entries."""
+        global _VK_MAP
+        if _VK_MAP is None:
+            _VK_MAP = {
+                key.vk: key_code
+                for key, key_code in self.key_map.items()
+                if isinstance(key, self.keyboard.KeyCode) and key.vk is not None
+            }
+        return _VK_MAP
 
     def on_input_event(self, event):
         """
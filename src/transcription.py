@@ -1,8 +1,76 @@
 import numpy as np
 from faster_whisper import WhisperModel
 
+try:
+    from faster_whisper import BatchedInferencePipeline
+except ImportError:  # Not available before faster-whisper 1.1
+    BatchedInferencePipeline = None
+
 from utils import ConfigManager
 
+# Scale factor to map int16 samples into [-1.0, 1.0) (1 / 32768).
+_INT16_SCALE = np.float32(1.0 / 32768.0)
+
+# Reusable float32 conversion buffer, grown as needed and kept between
+# recordings to avoid reallocating a multi-MB array per transcription.
+_conversion_buffer = None
+
+# Loaded models keyed on (model, device, compute_type). Loading re-mmaps
+# the weights and rebuilds the CTranslate2 runtime, so reuse instances
+# across config reloads.
+_model_cache = {}
+
+# Recordings longer than this are transcribed through the batched pipeline,
+# which chunks the audio and runs the encoder on several windows at once.
+_BATCH_THRESHOLD_SECONDS = 30
+_BATCH_SIZE = 8
+_SAMPLE_RATE = 16000
+
+# Batched pipelines wrap an existing model, cached per model instance.
+_pipeline_cache = {}
+
+def _get_batched_pipeline(local_model):
+    """Get (or create) the cached BatchedInferencePipeline for a model."""
+    pipeline = _pipeline_cache.get(id(local_model))
+    if pipeline is None:
+        pipeline = BatchedInferencePipeline(model=local_model)
+        _pipeline_cache[id(local_model)] = pipeline
+    return pipeline
+
+def _convert_to_float32(audio_data):
+    """Convert int16 audio samples to float32 in a single vectorized pass."""
+    global _conversion_buffer
+    if _conversion_buffer is None or _conversion_buffer.size < audio_data.size:
+        _conversion_buffer = np.empty(audio_data.size, dtype=np.float32)
+    audio_data_float = _conversion_buffer[:audio_data.size]
+    np.multiply(audio_data, _INT16_SCALE, out=audio_data_float)
+    return audio_data_float
+
+# Silence-trimming parameters: 10ms frames at 16 kHz, an RMS floor below
+# which a frame counts as silence (samples are in [-1.0, 1.0]), and a few
+# frames of context kept on each side of the detected speech.
+_TRIM_FRAME_SIZE = 160
+_TRIM_RMS_THRESHOLD = 0.005
+_TRIM_PADDING_FRAMES = 5
+
+def _trim_silence(audio_data_float):
+    """Trim leading and trailing silence using per-frame RMS energy."""
+    frame_count = audio_data_float.size // _TRIM_FRAME_SIZE
+    if frame_count < 2:
+        return audio_data_float
+
+    frames = audio_data_float[:frame_count * _TRIM_FRAME_SIZE].reshape(frame_count, _TRIM_FRAME_SIZE)
+    rms = np.sqrt(np.mean(frames * frames, axis=1))
+    loud_frames = np.flatnonzero(rms > _TRIM_RMS_THRESHOLD)
+    if loud_frames.size == 0:
+        return audio_data_float
+
+    start_frame = max(loud_frames[0] - _TRIM_PADDING_FRAMES, 0)
+    end_frame = min(loud_frames[-1] + 1 + _TRIM_PADDING_FRAMES, frame_count)
+    start = start_frame * _TRIM_FRAME_SIZE
+    end = audio_data_float.size if end_frame == frame_count else end_frame * _TRIM_FRAME_SIZE
+    return audio_data_float[start:end]
+
 def create_local_model():
     """
     Create a local model using the faster-whisper library.
@@ -18,6 +86,19 @@ def create_local_model():
     else:
         device = local_model_options['device']
 
+    if compute_type == 'default':
+        # Quantize unless the user asked for a specific precision: pure int8
+        # on CPU, int8 weights with float16 activations on GPU.
+        compute_type = 'int8' if device == 'cpu' else 'int8_float16'
+        ConfigManager.console_print(f'Using {compute_type} quantization.')
+
+    model_name = model_path or local_model_options['model']
+    cache_key = (model_name, device, compute_type)
+    model = _model_cache.get(cache_key)
+    if model is not None:
+        ConfigManager.console_print('Reusing cached local model.')
+        return model
+
     try:
         if model_path:
             ConfigManager.console_print(f'Loading model from: {model_path}')
@@ -29,13 +110,18 @@ def create_local_model():
             model = WhisperModel(local_model_options['model'],
                                  device=device,
                                  compute_type=compute_type)
+        _model_cache[cache_key] = model
     except Exception as e:
         ConfigManager.console_print(f'Error initializing WhisperModel: {e}')
         ConfigManager.console_print('Falling back to CPU.')
-        model = WhisperModel(model_path or local_model_options['model'],
-                             device='cpu',
-                             compute_type=compute_type,
-                             download_root=None if model_path else None)
+        fallback_key = (model_name, 'cpu', compute_type)
+        model = _model_cache.get(fallback_key)
+        if model is None:
+            model = WhisperModel(model_name,
+                                 device='cpu',
+                                 compute_type=compute_type,
+                                 download_root=None if model_path else None)
+            _model_cache[fallback_key] = model
 
     ConfigManager.console_print('Local model created.')
     return model
@@ -47,30 +133,36 @@ def transcribe_local(audio_data, local_model=None):
     model_options = ConfigManager.get_config_section('model_options')
 
     # Convert int16 to float32
-    audio_data_float = audio_data.astype(np.float32) / 32768.0
+    audio_data_float = _convert_to_float32(audio_data)
+
+    # Drop leading/trailing silence (e.g. push-to-talk release lag) so the
+    # encoder doesn't process empty 30-second windows.
+    audio_data_float = _trim_silence(audio_data_float)
 
-    response = local_model.transcribe(audio=audio_data_float,
-                                      language=model_options['common']['language'],
-                                      initial_prompt=model_options['common']['initial_prompt'],
-                                      condition_on_previous_text=model_options['local']['condition_on_previous_text'],
-                                      temperature=model_options['common']['temperature'],
-                                      vad_filter=model_options['local']['vad_filter'],)
-    return ''.join([segment.text for segment in list(response[0])])
+    transcribe_options = {
+        'language': model_options['common']['language'],
+        'initial_prompt': model_options['common']['initial_prompt'],
+        'condition_on_previous_text': model_options['local']['condition_on_previous_text'],
+        'temperature': model_options['common']['temperature'],
+        'vad_filter': model_options['local']['vad_filter'],
+    }
+
+    if (BatchedInferencePipeline is not None
+            and audio_data_float.size > _BATCH_THRESHOLD_SECONDS * _SAMPLE_RATE):
+        pipeline = _get_batched_pipeline(local_model)
+        response = pipeline.transcribe(audio=audio_data_float,
+                                       batch_size=_BATCH_SIZE,
+                                       **transcribe_options)
+    else:
+        response = local_model.transcribe(audio=audio_data_float,
+                                          **transcribe_options)
+    return ''.join(segment.text for segment in response[0])
 
 def post_process_transcription(transcription):
     """
     Apply post-processing to the transcription.
     """
-    transcription = transcription.strip()
-    post_processing = ConfigManager.get_config_section('post_processing')
-    if post_processing['remove_trailing_period'] and transcription.endswith('.'):
-        transcription = transcription[:-1]
-    if post_processing['add_trailing_space']:
-        transcription += ' '
-    if post_processing['remove_capitalization']:
-        transcription = transcription.lower()
-
-    return transcription
+    return ConfigManager.get_post_processor()(transcription)
 
 def transcribe(audio_data, local_model=None):
     """
@@ -1,5 +1,6 @@
 import yaml
 import os
+from functools import reduce
 
 class ConfigManager:
     _instance = None
@@ -8,6 +9,8 @@ class ConfigManager:
         """Initialize the ConfigManager instance."""
         self.config = None
         self.schema = None
+        self._section_cache = {}
+        self._postproc_fn = None
 
     @classmethod
     def initialize(cls, schema_path=None):
@@ -27,18 +30,58 @@ class ConfigManager:
 
     @classmethod
     def get_config_section(cls, *keys):
-        """Get a specific section of the configuration."""
+        """Get a specific section of the configuration. Results are cached until the config changes."""
         if cls._instance is None:
             raise RuntimeError("ConfigManager not initialized")
 
+        cache = cls._instance._section_cache
+        if keys in cache:
+            return cache[keys]
+
         section = cls._instance.config
         for key in keys:
             if isinstance(section, dict) and key in section:
                 section = section[key]
             else:
-                return {}
+                section = {}
+                break
+        cache[keys] = section
         return section
 
+    @classmethod
+    def invalidate_cache(cls):
+        """Drop cached config lookups after the configuration has changed."""
+        if cls._instance is None:
+            return
+        cls._instance._section_cache.clear()
+        cls._instance._postproc_fn = None
+
+    @classmethod
+    def get_post_processor(cls):
+        """Get a post-processing function compiled from the current configuration."""
+        if cls._instance is None:
+            raise RuntimeError("ConfigManager not initialized")
+
+        fn = cls._instance._postproc_fn
+        if fn is None:
+            fn = cls._instance._build_post_processor()
+            cls._instance._postproc_fn = fn
+        return fn
+
+    def _build_post_processor(self):
+        """Compose only the active post-processing transformations into one function."""
+        post_processing = self.config.get('post_processing', {})
+
+        steps = [str.strip]
+        if post_processing.get('remove_trailing_period'):
+            steps.append(lambda text: text[:-1] if text.endswith('.') else text)
+        if post_processing.get('add_trailing_space'):
+            steps.append(lambda text: text + ' ')
+        if post_processing.get('remove_capitalization'):
+            steps.append(str.lower)
+
+        return lambda text: reduce(lambda value, step: step(value), steps, text)
+
     @classmethod
     def get_config_value(cls, *keys):
         """Get a specific configuration value using nested keys."""
@@ -67,6 +110,7 @@ class ConfigManager:
                 config[key] = {}
             config = config[key]
         config[keys[-1]] = value
+        cls.invalidate_cache()
 
     @staticmethod
     def load_config_schema(schema_path=None):
@@ -128,6 +172,7 @@ class ConfigManager:
             raise RuntimeError("ConfigManager not initialized")
         cls._instance.config = cls._instance.load_default_config()
         cls._instance.load_user_config()
+        cls.invalidate_cache()
 
     @classmethod
     def config_file_exists(cls):